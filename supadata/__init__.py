@@ -6,6 +6,7 @@ The official Python SDK for Supadata - scrape web and YouTube content with ease.
 
 from importlib.metadata import version
 
+from supadata.async_client import AsyncSupadata
 from supadata.client import Supadata
 from supadata.errors import SupadataError
 from supadata.types import (
@@ -33,6 +34,7 @@ from supadata.types import (
 __version__ = version("supadata")
 __all__ = [
     "Supadata",
+    "AsyncSupadata",
     "Transcript",
     "TranslatedTranscript",
     "TranscriptChunk",
@@ -0,0 +1,535 @@
+"""Asynchronous Supadata client implementation."""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Union
+
+try:
+    import httpx
+except ImportError:  # optional dependency, see the "async" extra
+    httpx = None
+
+import warnings
+
+from .client import (
+    _SDK_VERSION,
+    _decode,
+    _encode_json_body,
+    _error_from_body,
+    _extract_body,
+    _partial_content_error,
+    _transcript_from_response,
+    _transcript_params,
+)
+from .types import (
+    BatchJob,
+    CrawlJob,
+    CrawlPage,
+    ExtractJob,
+    ExtractResult,
+    Map,
+    Metadata,
+    Scrape,
+    Transcript,
+    BatchResults,
+    YoutubeChannel,
+    YoutubePlaylist,
+    YoutubeVideo,
+)
+from .web import _crawl_body, _crawl_pages
+from .youtube import (
+    _BACKOFF_FACTOR,
+    _BATCH_DONE_STATUSES,
+    _channel_from_response,
+    _playlist_from_response,
+    _poll_deadline,
+    _poll_delay,
+    _video_from_response,
+)
+
+
+# Sleep used by batch polling; module-level so tests can replace it here
+# without patching asyncio globally
+_sleep = asyncio.sleep
+
+
+class _AsyncExtract:
+    """Async extract namespace for starting extract jobs and getting results."""
+
+    def __init__(self, request_fn):
+        self._request = request_fn
+
+    async def __call__(
+        self,
+        url: str,
+        prompt: str = None,
+        schema: dict = None,
+    ) -> ExtractJob:
+        """Start an extract job to analyze video content.
+
+        Args:
+            url: URL to any supported video media
+            prompt: Description of what data to extract (required if schema is not provided)
+            schema: JSON Schema defining the structure of data to extract (required if prompt is not provided)
+
+        Returns:
+            ExtractJob with job_id for polling results
+        """
+        response = await self._request("POST", "/extract", json=_extract_body(url, prompt, schema))
+        return ExtractJob.from_dict(response)
+
+    async def get_results(self, job_id: str) -> ExtractResult:
+        """Get results for an extract job.
+
+        Args:
+            job_id: The extract job ID
+
+        Returns:
+            ExtractResult with status and extracted data
+        """
+        response = await self._request("GET", f"/extract/{job_id}")
+        return ExtractResult.from_dict(response)
+
+
+class _AsyncWeb:
+    """Async web namespace for Supadata operations."""
+
+    def __init__(self, request_handler):
+        self._request = request_handler
+
+    async def scrape(self, url: str) -> Scrape:
+        """Scrape content from a web page.
+
+        Args:
+            url: URL to scrape
+
+        Returns:
+            Scrape object containing the extracted content
+
+        Raises:
+            SupadataError: If the API request fails
+        """
+        response = await self._request("GET", "/web/scrape", params={"url": url})
+        return Scrape.from_dict(response)
+
+    async def scrape_many(self, urls: Iterable[str], concurrency: int = 16) -> List[Scrape]:
+        """Scrape several web pages concurrently.
+
+        Args:
+            urls: URLs to scrape
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List of Scrape objects, in the same order as ``urls``
+
+        Raises:
+            SupadataError: If any of the API requests fails
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(url: str) -> Scrape:
+            async with semaphore:
+                return await self.scrape(url)
+
+        return list(await asyncio.gather(*(fetch(url) for url in urls)))
+
+    async def map(self, url: str) -> Map:
+        """Generate a site map for a website.
+
+        Args:
+            url: Base URL to map
+
+        Returns:
+            Map object containing discovered URLs
+
+        Raises:
+            SupadataError: If the API request fails
+        """
+        response = await self._request("GET", "/web/map", params={"url": url})
+        return Map.from_dict(response)
+
+    async def crawl(self, url: str, limit: Optional[int] = None) -> CrawlJob:
+        """Start a new crawl job.
+
+        Args:
+            url: URL to crawl
+            limit: Optional maximum number of pages to crawl
+
+        Returns:
+            CrawlJob containing the job ID
+
+        Raises:
+            SupadataError: If the crawl job failed
+        """
+        response = await self._request("POST", "/web/crawl", json=_crawl_body(url, limit))
+        return CrawlJob.from_dict(response)
+
+    async def get_crawl_results(self, job_id: str) -> List[CrawlPage]:
+        """Get the results of a crawl job.
+
+        This method handles pagination automatically and returns all results.
+
+        Args:
+            job_id: ID of the crawl job
+
+        Returns:
+            List of CrawlPage objects containing the crawled content
+
+        Raises:
+            SupadataError: If the crawl job failed
+        """
+        return [page async for page in self.iter_crawl_results(job_id)]
+
+    async def iter_crawl_results(self, job_id: str) -> AsyncIterator[CrawlPage]:
+        """Iterate over the results of a crawl job.
+
+        The next page of results is only requested once the previous one has
+        been consumed, so large crawls never have to be held in memory at once.
+
+        Args:
+            job_id: ID of the crawl job
+
+        Yields:
+            CrawlPage objects containing the crawled content
+
+        Raises:
+            SupadataError: If the crawl job failed
+        """
+        next_token = None
+
+        while True:
+            params = {"next": next_token} if next_token else {}
+            response = await self._request("GET", f"/web/crawl/{job_id}", params=params)
+            pages, next_token = _crawl_pages(response)
+            for page in pages:
+                yield page
+
+            if not next_token:
+                break
+
+
+class _AsyncChannel:
+    __slots__ = ("_youtube",)
+
+    def __init__(self, youtube: "_AsyncYouTube"):
+        self._youtube = youtube
+
+    async def __call__(self, id: str) -> YoutubeChannel:
+        """Get the channel metadata for a YouTube Channel.
+
+        Args:
+            id: YouTube Channel ID, URL, or handle (@username)
+
+        Returns:
+            YoutubeChannel object containing the metadata
+
+        Raises:
+            SupadataError: If the API request fails
+        """
+        response = await self._youtube._request("GET", "/youtube/channel", params={"id": id})
+        return _channel_from_response(response, id)
+
+
+class _AsyncPlaylist:
+    __slots__ = ("_youtube",)
+
+    def __init__(self, youtube: "_AsyncYouTube"):
+        self._youtube = youtube
+
+    async def __call__(self, id: str) -> YoutubePlaylist:
+        """Get the playlist metadata for a YouTube public playlist.
+
+        Args:
+            id: YouTube playlist ID or URL
+
+        Returns:
+            YoutubePlaylist object containing the metadata
+
+        Raises:
+            SupadataError: If the API request fails
+        """
+        response = await self._youtube._request("GET", "/youtube/playlist", params={"id": id})
+        return _playlist_from_response(response, id)
+
+
+class _AsyncVideo:
+    __slots__ = ("_youtube",)
+
+    def __init__(self, youtube: "_AsyncYouTube"):
+        self._youtube = youtube
+
+    async def __call__(self, id: str) -> YoutubeVideo:
+        """Get the video metadata for a YouTube video.
+
+        .. deprecated::
+            Use `AsyncSupadata.metadata()` instead for unified metadata retrieval across platforms.
+
+        Args:
+            id: YouTube video ID or URL
+
+        Returns:
+            YoutubeVideo object containing the metadata
+
+        Raises:
+            SupadataError: If the API request fails
+        """
+        warnings.warn(
+            "AsyncSupadata.youtube.video() is deprecated. Use AsyncSupadata.metadata() instead for unified metadata retrieval across platforms.",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        response = await self._youtube._request("GET", "/youtube/video", params={"id": id})
+        return _video_from_response(response, id)
+
+
+class _AsyncBatch:
+    __slots__ = ("_youtube",)
+
+    def __init__(self, youtube: "_AsyncYouTube"):
+        self._youtube = youtube
+
+    async def get_batch_results(self, job_id: str) -> BatchResults:
+        """Get the status and results of a batch job.
+
+        Args:
+            job_id: The ID of the batch job
+
+        Returns:
+            BatchResults object containing status, results, and stats
+
+        Raises:
+            SupadataError: If the API request fails
+        """
+        response = await self._youtube._request("GET", f"/youtube/batch/{job_id}")
+        return BatchResults.from_dict(response)
+
+    async def poll_until_done(
+        self,
+        job_id: str,
+        timeout: float = 600,
+        initial_delay: float = 0.5,
+        max_delay: float = 30,
+    ) -> BatchResults:
+        """Poll a batch job until it completes or fails, backing off exponentially.
+
+        Several jobs can be awaited together with ``asyncio.gather``.
+
+        Args:
+            job_id: The ID of the batch job
+            timeout: Maximum number of seconds to wait
+            initial_delay: Seconds to wait after the first unfinished poll
+            max_delay: Upper bound for the wait between polls
+
+        Returns:
+            BatchResults object with status 'completed' or 'failed'
+
+        Raises:
+            SupadataError: If the API request fails or the job does not finish
+                within ``timeout`` seconds
+        """
+        deadline = _poll_deadline(timeout)
+        delay = initial_delay
+        while True:
+            results = await self.get_batch_results(job_id)
+            if results.status in _BATCH_DONE_STATUSES:
+                return results
+            await _sleep(_poll_delay(deadline, delay, job_id, timeout))
+            delay = min(delay * _BACKOFF_FACTOR, max_delay)
+
+
+class _AsyncYouTube:
+    """Async YouTube namespace for metadata lookups and batch results.
+
+    Mirrors the attribute layout of the sync ``YouTube`` namespace, so
+    ``channel``, ``playlist`` and ``video`` are awaitable callables and batch
+    results live under ``batch``.
+    """
+
+    def __init__(self, request_handler):
+        self._request = request_handler
+        self.channel = _AsyncChannel(self)
+        self.playlist = _AsyncPlaylist(self)
+        self.video = _AsyncVideo(self)
+        self.batch = _AsyncBatch(self)
+
+
+class AsyncSupadata:
+    """Asynchronous Supadata client.
+
+    Mirrors :class:`Supadata` with awaitable methods so many API calls can be
+    overlapped, e.g. ``await asyncio.gather(*(client.web.scrape(u) for u in urls))``.
+    Requests share one ``httpx.AsyncClient`` with HTTP/2 enabled, so concurrent
+    calls are multiplexed over a single connection. Requires the ``async`` extra.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.supadata.ai/v1",
+        pool_size: int = 64,
+    ):
+        """Initialize async Supadata client.
+
+        Args:
+            api_key: Your Supadata API key
+            base_url: Optional custom API base URL
+            pool_size: Maximum number of keep-alive connections to hold open
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncSupadata requires httpx. Install it with: pip install \"supadata[async]\""
+            )
+
+        self.base_url = base_url
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=pool_size),
+            headers={
+                "x-api-key": api_key,
+                "Accept": "application/json",
+                "User-Agent": f"Supadata-Python-SDK/{_SDK_VERSION}"
+            },
+        )
+
+        # Initialize namespaces
+        self.web = _AsyncWeb(self._request)
+        self.youtube = _AsyncYouTube(self._request)
+        self.extract = _AsyncExtract(self._request)
+
+    async def __aenter__(self) -> "AsyncSupadata":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        await self._client.aclose()
+
+    async def metadata(self, url: str) -> Metadata:
+        """Get metadata from a media URL.
+
+        Args:
+            url: Media URL from supported platforms (YouTube, TikTok, Instagram, Twitter)
+
+        Returns:
+            Metadata object containing media information
+
+        Raises:
+            SupadataError: If the metadata request fails
+        """
+        response = await self._request("GET", "/metadata", params={"url": url})
+        return Metadata.from_dict(response)
+
+    async def metadata_many(self, urls: Iterable[str], concurrency: int = 16) -> List[Metadata]:
+        """Get metadata for several media URLs concurrently.
+
+        Args:
+            urls: Media URLs from supported platforms
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List of Metadata objects, in the same order as ``urls``
+
+        Raises:
+            SupadataError: If any of the metadata requests fails
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(url: str) -> Metadata:
+            async with semaphore:
+                return await self.metadata(url)
+
+        return list(await asyncio.gather(*(fetch(url) for url in urls)))
+
+    async def transcript(
+        self,
+        url: str,
+        lang: str = None,
+        text: bool = False,
+        chunk_size: int = None,
+        mode: str = "auto"
+    ) -> Union[Transcript, BatchJob]:
+        """Get transcript from a video URL.
+
+        Args:
+            url: Video URL from supported platforms (YouTube, TikTok, Instagram, Twitter) or file URL
+            lang: Optional preferred language code (ISO 639-1)
+            text: Return plain text transcript instead of timestamped chunks
+            chunk_size: Maximum characters per transcript chunk
+            mode: Transcript retrieval mode - "native", "auto", or "generate"
+
+        Returns:
+            Transcript object if transcript is available immediately,
+            or BatchJob with job_id for asynchronous processing
+
+        Raises:
+            SupadataError: If the transcript request fails
+        """
+        params = _transcript_params(url, lang, text, chunk_size, mode)
+        response = await self._request("GET", "/transcript", params=params)
+        return _transcript_from_response(response)
+
+    async def transcript_many(
+        self,
+        urls: Iterable[str],
+        lang: str = None,
+        text: bool = False,
+        chunk_size: int = None,
+        mode: str = "auto",
+        concurrency: int = 16
+    ) -> List[Union[Transcript, BatchJob]]:
+        """Get transcripts for several video URLs concurrently.
+
+        Args:
+            urls: Video URLs from supported platforms or file URLs
+            lang: Optional preferred language code (ISO 639-1)
+            text: Return plain text transcripts instead of timestamped chunks
+            chunk_size: Maximum characters per transcript chunk
+            mode: Transcript retrieval mode - "native", "auto", or "generate"
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List of Transcript or BatchJob objects, in the same order as ``urls``
+
+        Raises:
+            SupadataError: If any of the transcript requests fails
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(url: str) -> Union[Transcript, BatchJob]:
+            async with semaphore:
+                return await self.transcript(url, lang, text, chunk_size, mode)
+
+        return list(await asyncio.gather(*(fetch(url) for url in urls)))
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        """Make an HTTP request to the Supadata API.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            **kwargs: Additional arguments to pass to httpx
+
+        Returns:
+            dict: Parsed JSON response
+
+        Raises:
+            SupadataError: If a gateway error occurs
+            httpx.HTTPError: If the API request fails
+        """
+        url = f"{self.base_url}{path}"
+        _encode_json_body(kwargs, "content")
+        response = await self._client.request(method, url, **kwargs)
+
+        # Treat 206 Partial Content as an error for transcript endpoints
+        if response.status_code == 206 and ('/transcript' in path):
+            raise _partial_content_error(response.json())
+
+        try:
+            response.raise_for_status()
+            return _decode(response.content)
+        except httpx.HTTPStatusError as e:
+            try:
+                raise _error_from_body(e.response.json()) from e
+            except (ValueError, KeyError):
+                raise e
@@ -1,9 +1,19 @@
 """Main Supadata client implementation."""
 
-from typing import Any, Dict, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Union
 import importlib.metadata
+import json
+from urllib.parse import quote, urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
 from supadata.errors import SupadataError
 
@@ -11,6 +21,200 @@ from .web import Web
 from .youtube import YouTube
 from .types import Transcript, BatchJob, Metadata, ExtractJob, ExtractResult
 
+try:
+    _SDK_VERSION = importlib.metadata.version("supadata")
+except importlib.metadata.PackageNotFoundError:
+    _SDK_VERSION = "unknown"
+
+
+def _to_snake(name: str) -> str:
+    """Convert a single camelCase key to snake_case.
+
+    An underscore is inserted before an uppercase letter that follows a
+    lowercase letter or digit, or that starts a capitalized word
+    (``HTTPResponse`` -> ``http_response``).
+    """
+    if name.islower():
+        # No uppercase letters, nothing to split; skip the per-character scan
+        return name
+    out = []
+    last = len(name) - 1
+    prev_lower = False
+    for i, c in enumerate(name):
+        if 'A' <= c <= 'Z':
+            if prev_lower or (0 < i < last and 'a' <= name[i + 1] <= 'z'):
+                out.append('_')
+            prev_lower = False
+        else:
+            prev_lower = 'a' <= c <= 'z' or '0' <= c <= '9'
+        out.append(c)
+    return ''.join(out).lower()
+
+
+_MAX_CACHED_KEYS = 4096
+
+
+class _SnakeKeyCache(dict):
+    """Memo of camelCase -> snake_case key conversions.
+
+    Lookups of already-seen keys are a single dict access. Unknown keys are
+    converted on first use and remembered up to ``_MAX_CACHED_KEYS`` entries,
+    which bounds growth from free-form keys such as extract results.
+    """
+
+    def __missing__(self, name: str) -> str:
+        snake = _to_snake(name)
+        if len(self) < _MAX_CACHED_KEYS:
+            self[name] = snake
+        return snake
+
+
+# camelCase keys returned by the API, resolved without scanning
+_KNOWN_KEYS = {
+    "additionalData": "additional_data",
+    "availableLangs": "available_langs",
+    "avatarUrl": "avatar_url",
+    "channelId": "channel_id",
+    "chunkSize": "chunk_size",
+    "completedAt": "completed_at",
+    "countCharacters": "count_characters",
+    "createdAt": "created_at",
+    "displayName": "display_name",
+    "documentationUrl": "documentation_url",
+    "errorCode": "error_code",
+    "jobId": "job_id",
+    "lastUpdated": "last_updated",
+    "likeCount": "like_count",
+    "liveIds": "live_ids",
+    "ogUrl": "og_url",
+    "playlistId": "playlist_id",
+    "shortIds": "short_ids",
+    "subscriberCount": "subscriber_count",
+    "thumbnailUrl": "thumbnail_url",
+    "totalResults": "total_results",
+    "transcriptLanguages": "transcript_languages",
+    "uploadDate": "upload_date",
+    "uploadedDate": "uploaded_date",
+    "videoCount": "video_count",
+    "videoId": "video_id",
+    "videoIds": "video_ids",
+    "viewCount": "view_count",
+}
+
+_convert = _SnakeKeyCache(_KNOWN_KEYS).__getitem__
+
+
+def _snake_keys(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON ``object_hook`` converting each decoded object's keys to snake_case.
+
+    The decoder calls this bottom-up for every object, so nested dicts inside
+    lists are converted during parsing without a second traversal.
+    """
+    return {_convert(k): v for k, v in obj.items()}
+
+
+# Keys of a standard API error body mapped to SupadataError fields
+_ERROR_FIELDS = {
+    "error": "error",
+    "message": "message",
+    "details": "details",
+    "documentationUrl": "documentation_url",
+}
+
+
+def _camel_to_snake(d: Any) -> Any:
+    """Convert dictionary keys from camelCase to snake_case.
+
+    The structure is walked with an explicit stack and re-keyed in place,
+    so only pass freshly decoded JSON that nothing else references.
+    """
+    stack = [d] if isinstance(d, (dict, list)) else []
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if any(not k.islower() for k in node):
+                items = list(node.items())
+                node.clear()
+                node.update((_convert(k), v) for k, v in items)
+            children = node.values()
+        else:
+            children = node
+        stack.extend(v for v in children if isinstance(v, (dict, list)))
+    return d
+
+
+def _decode(content: bytes) -> Any:
+    """Decode a JSON response body into a structure with snake_case keys.
+
+    Uses orjson when installed; it has no object_hook, so keys are
+    converted in a pass afterwards, which is still faster overall than
+    the stdlib decoder with a hook.
+    """
+    if orjson is not None:
+        return _camel_to_snake(orjson.loads(content))
+    return json.loads(content, object_hook=_snake_keys)
+
+
+def _encode_json_body(kwargs: Dict[str, Any], body_arg: str) -> None:
+    """Serialize a ``json=`` request body with orjson when it is installed.
+
+    The encoded bytes are moved to ``body_arg`` (``data`` for requests,
+    ``content`` for httpx) with an explicit content type; without orjson the
+    HTTP library's own JSON encoding is left in place.
+    """
+    if orjson is not None and kwargs.get("json") is not None:
+        kwargs[body_arg] = orjson.dumps(kwargs.pop("json"))
+        kwargs["headers"] = {**kwargs.get("headers", {}), "Content-Type": "application/json"}
+
+
+def _error_from_body(error_data: Dict[str, Any]) -> SupadataError:
+    """Build a SupadataError from a decoded API error body.
+
+    Standard error bodies are mapped directly; anything else goes through
+    the generic key conversion first.
+    """
+    if error_data.keys() <= _ERROR_FIELDS.keys():
+        return SupadataError(**{_ERROR_FIELDS[k]: v for k, v in error_data.items()})
+    return SupadataError(**_camel_to_snake(error_data))
+
+
+def _partial_content_error(error_data: Dict[str, Any]) -> SupadataError:
+    """Build the error raised for a 206 Partial Content transcript response."""
+    if 'error' in error_data:
+        return _error_from_body(error_data)
+    return SupadataError(error="transcript-unavailable", message="No Transcript", details="No transcript available")
+
+
+def _extract_body(url: str, prompt: Optional[str], schema: Optional[dict]) -> Dict[str, Any]:
+    """Build the request body for starting an extract job."""
+    body = {"url": url}
+    if prompt is not None:
+        body["prompt"] = prompt
+    if schema is not None:
+        body["schema"] = schema
+    return body
+
+
+def _transcript_params(
+    url: str, lang: Optional[str], text: bool, chunk_size: Optional[int], mode: str
+) -> Dict[str, Any]:
+    """Build the query parameters for a /transcript request."""
+    params = {"url": url, "mode": mode}
+    if lang is not None:
+        params["lang"] = lang
+    if text:
+        params["text"] = "true"
+    if chunk_size is not None:
+        params["chunkSize"] = chunk_size
+    return params
+
+
+def _transcript_from_response(response: Dict[str, Any]) -> Union[Transcript, BatchJob]:
+    """Build a Transcript, or a BatchJob when the transcript is processed asynchronously."""
+    if "job_id" in response:
+        return BatchJob(job_id=response["job_id"])
+    return Transcript.from_dict(response)
+
 
 class _Extract:
     """Extract namespace for starting extract jobs and getting results."""
@@ -34,13 +238,8 @@ class _Extract:
         Returns:
             ExtractJob with job_id for polling results
         """
-        body = {"url": url}
-        if prompt is not None:
-            body["prompt"] = prompt
-        if schema is not None:
-            body["schema"] = schema
-        response = self._request("POST", "/extract", json=body)
-        return ExtractJob(**response)
+        response = self._request("POST", "/extract", json=_extract_body(url, prompt, schema))
+        return ExtractJob.from_dict(response)
 
     def get_results(self, job_id: str) -> ExtractResult:
         """Get results for an extract job.
@@ -52,18 +251,25 @@ class _Extract:
             ExtractResult with status and extracted data
         """
         response = self._request("GET", f"/extract/{job_id}")
-        return ExtractResult(**response)
+        return ExtractResult.from_dict(response)
 
 
 class Supadata:
     """Main Supadata client."""
 
-    def __init__(self, api_key: str, base_url: str = "https://api.supadata.ai/v1"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.supadata.ai/v1",
+        pool_size: int = 32,
+    ):
         """Initialize Supadata client.
 
         Args:
             api_key: Your Supadata API key
             base_url: Optional custom API base URL
+            pool_size: Maximum number of pooled keep-alive connections, i.e. how
+                many requests can run concurrently without opening new connections
         """
 
         self.base_url = base_url
@@ -71,8 +277,19 @@ class Supadata:
         self.session.headers.update({
             "x-api-key": api_key,
             "Accept": "application/json",
-            "User-Agent": f"Supadata-Python-SDK/{importlib.metadata.version('supadata')}"
+            "User-Agent": f"Supadata-Python-SDK/{_SDK_VERSION}"
         })
+        adapter = HTTPAdapter(
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         # Initialize namespaces
         self.youtube = YouTube(self._request)
@@ -92,7 +309,7 @@ class Supadata:
             SupadataError: If the metadata request fails
         """
         response = self._request("GET", "/metadata", params={"url": url})
-        return Metadata(**response)
+        return Metadata.from_dict(response)
 
     def transcript(
         self,
@@ -118,36 +335,42 @@ class Supadata:
         Raises:
             SupadataError: If the transcript request fails
         """
-        params = {"url": url, "mode": mode}
+        params = _transcript_params(url, lang, text, chunk_size, mode)
+        response = self._request("GET", "/transcript", params=params)
+        return _transcript_from_response(response)
 
-        if lang is not None:
-            params["lang"] = lang
-        if text:
-            params["text"] = str(text).lower()
-        if chunk_size is not None:
-            params["chunkSize"] = chunk_size
+    def transcript_many(
+        self,
+        urls: Iterable[str],
+        lang: str = None,
+        text: bool = False,
+        chunk_size: int = None,
+        mode: str = "auto",
+        concurrency: int = 16
+    ) -> List[Union[Transcript, BatchJob]]:
+        """Get transcripts for several video URLs concurrently.
 
-        response = self._request("GET", "/transcript", params=params)
+        Requests run on a thread pool and share the client's connection pool, so
+        keep ``concurrency`` at or below the client's ``pool_size``.
 
-        # Check if response contains a job_id (async processing)
-        if "job_id" in response:
-            return BatchJob(job_id=response["job_id"])
-
-        # Otherwise, return the transcript directly
-        return Transcript(**response)
-
-    def _camel_to_snake(self, d: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert dictionary keys from camelCase to snake_case."""
-        import re
-        def convert(name: str) -> str:
-            name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-            return re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
-        
-        if isinstance(d, dict):
-            return {convert(k): self._camel_to_snake(v) for k, v in d.items()}
-        if isinstance(d, list):
-            return [self._camel_to_snake(i) for i in d]
-        return d
+        Args:
+            urls: Video URLs from supported platforms or file URLs
+            lang: Optional preferred language code (ISO 639-1)
+            text: Return plain text transcripts instead of timestamped chunks
+            chunk_size: Maximum characters per transcript chunk
+            mode: Transcript retrieval mode - "native", "auto", or "generate"
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List of Transcript or BatchJob objects, in the same order as ``urls``
+
+        Raises:
+            SupadataError: If any of the transcript requests fails
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(
+                lambda url: self.transcript(url, lang, text, chunk_size, mode), urls
+            ))
 
     def _request(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
         """Make an HTTP request to the Supadata API.
@@ -165,23 +388,26 @@ class Supadata:
             requests.exceptions.RequestException: If the API request fails
         """
         url = f"{self.base_url}{path}"
+        params = kwargs.pop("params", None)
+        if params:
+            # Encode the query string here rather than through requests' generic
+            # params handling; None values are dropped, as requests does
+            query = [(k, v) for k, v in params.items() if v is not None]
+            url = f"{url}?{urlencode(query, doseq=True, quote_via=quote)}"
+        _encode_json_body(kwargs, "data")
         response = self.session.request(method, url, **kwargs)
 
         # Treat 206 Partial Content as an error for transcript endpoints
         if response.status_code == 206 and ('/transcript' in path):
-            error_data = self._camel_to_snake(response.json())
-            if 'error' in error_data:
-                raise SupadataError(**error_data)
-            raise SupadataError(error="transcript-unavailable", message="No Transcript", details="No transcript available")
+            raise _partial_content_error(response.json())
 
         try:
             response.raise_for_status()
-            return self._camel_to_snake(response.json())
+            return _decode(response.content)
         except requests.exceptions.HTTPError as e:
             if e.response is not None:
                 try:
-                    error_data = self._camel_to_snake(e.response.json())
-                    raise SupadataError(**error_data) from e
+                    raise _error_from_body(e.response.json()) from e
                 except (ValueError, KeyError):
                     raise e
             raise e 
\ No newline at end of file
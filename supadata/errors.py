@@ -4,7 +4,7 @@ from typing import Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class SupadataError(Exception):
     """Base exception for all Supadata errors.
     
@@ -19,6 +19,13 @@ class SupadataError(Exception):
     details: str
     documentation_url: Optional[str] = None
 
+    def __reduce__(self):
+        """Pickle by fields; the error is built with keywords so ``args`` is empty."""
+        return (
+            type(self),
+            (self.error, self.message, self.details, self.documentation_url),
+        )
+
     def __str__(self) -> str:
         """Return string representation of the error."""
         parts = [self.message]
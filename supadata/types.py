@@ -1,8 +1,29 @@
 """Type definitions for Supadata API responses."""
 
-from dataclasses import dataclass, field
+import array
+import functools
+import operator
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
-from typing import List, Optional, TypedDict, Union
+from typing import List, Optional, Tuple, TypedDict, Union
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC.
+
+    Raises:
+        ValueError: If the string is not a valid timestamp
+        TypeError: If the value is not a string
+    """
+    if isinstance(value, str) and value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _fields_of(dataclass_type) -> frozenset:
+    """Return the field names of a dataclass, computed once per class."""
+    return frozenset(dataclass_type.__dataclass_fields__)
 
 
 def filter_dict_for_dataclass(data: dict, dataclass_type) -> dict:
@@ -13,11 +34,63 @@ def filter_dict_for_dataclass(data: dict, dataclass_type) -> dict:
     if not hasattr(dataclass_type, '__dataclass_fields__'):
         return data
     
-    known_fields = set(dataclass_type.__dataclass_fields__.keys())
+    known_fields = _fields_of(dataclass_type)
+    if data.keys() <= known_fields:
+        return data
     return {k: v for k, v in data.items() if k in known_fields}
 
 
-@dataclass
+def _with_from_dict(cls):
+    """Add a ``from_dict`` classmethod building the dataclass from an API dict.
+
+    The constructor is generated once per class as straight-line code reading
+    each field from the dict with its default as fallback, so parsing needs no
+    per-call reflection or filtered copy of the dict. Keys the dataclass does
+    not define are ignored, so new API fields do not break construction.
+    """
+    namespace = {}
+    args = []
+    for f in fields(cls):
+        if not f.init:
+            continue
+        # Arguments are passed positionally in field order to avoid kwargs binding
+        key = repr(f.name)
+        if f.default is not MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            args.append(f"d.get({key}, _default_{f.name})")
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            args.append(f"d[{key}] if {key} in d else _factory_{f.name}()")
+        else:
+            args.append(f"d[{key}]")
+    exec(f"def from_dict(cls, d):\n    return cls({', '.join(args)})\n", namespace)
+    cls.from_dict = classmethod(namespace["from_dict"])
+    return cls
+
+
+def _construct(cls, values: dict):
+    """Create a dataclass instance from already-normalized values.
+
+    Fields are assigned directly and ``__post_init__`` is not run, so the values
+    must already have the types the normalization would produce. Omitted fields
+    take their defaults.
+    """
+    obj = cls.__new__(cls)
+    for f in fields(cls):
+        if f.name in values:
+            value = values[f.name]
+        elif f.default is not MISSING:
+            value = f.default
+        elif f.default_factory is not MISSING:
+            value = f.default_factory()
+        else:
+            raise TypeError(f"{cls.__name__}.construct() missing required field: '{f.name}'")
+        object.__setattr__(obj, f.name, value)
+    return obj
+
+
+@_with_from_dict
+@dataclass(slots=True)
 class TranscriptChunk:
     """A chunk of a video transcript.
 
@@ -34,7 +107,19 @@ class TranscriptChunk:
     lang: str = ""
 
 
-@dataclass
+_chunk_values = operator.itemgetter("text", "offset", "duration", "lang")
+
+
+def _transcript_chunk(data: dict) -> TranscriptChunk:
+    """Build a TranscriptChunk from an API dict, fetching all four fields in one call."""
+    try:
+        return TranscriptChunk(*_chunk_values(data))
+    except KeyError:
+        return TranscriptChunk.from_dict(data)
+
+
+@_with_from_dict
+@dataclass(slots=True)
 class Transcript:
     """A complete video transcript.
 
@@ -44,24 +129,57 @@ class Transcript:
         available_langs: List of available language codes
     """
 
-    content: Union[List[TranscriptChunk], str] = None
+    content: Union[List[TranscriptChunk], str] = field(default_factory=list)
     lang: str = ""
-    available_langs: List[str] = None
+    available_langs: List[str] = field(default_factory=list)
 
     def __post_init__(self):
+        # An explicit null from the API is treated like a missing field
         if self.content is None:
             self.content = []
         if self.available_langs is None:
             self.available_langs = []
-        # Convert list of dictionaries to TranscriptChunk objects
-        if isinstance(self.content, list):
+        # Convert list of dictionaries to TranscriptChunk objects; lists that
+        # already start with a TranscriptChunk are taken as fully built
+        content = self.content
+        if isinstance(content, list) and content and not isinstance(content[0], TranscriptChunk):
             self.content = [
-                chunk if isinstance(chunk, TranscriptChunk) else TranscriptChunk(**chunk)
-                for chunk in self.content
+                _transcript_chunk(chunk) if isinstance(chunk, dict) else chunk
+                for chunk in content
             ]
 
-
-@dataclass
+    @classmethod
+    def construct(cls, **values) -> "Transcript":
+        """Build a Transcript from already-normalized values, skipping ``__post_init__``."""
+        return _construct(cls, values)
+
+    def to_columns(self) -> Tuple[List[str], array.array, array.array, List[str]]:
+        """Split chunked content into per-field columns.
+
+        Offsets and durations are returned as ``array.array('d')``, which stores
+        each value as an 8-byte float instead of a Python object, for compact
+        storage and fast numeric scans over long transcripts. Floats are used so
+        fractional millisecond values from the API are kept as they are.
+
+        Returns:
+            Tuple of (texts, offsets, durations, langs)
+
+        Raises:
+            TypeError: If the transcript was requested as plain text
+        """
+        if isinstance(self.content, str):
+            raise TypeError("to_columns() requires chunked content; request the transcript with text=False")
+        chunks = self.content
+        return (
+            [chunk.text for chunk in chunks],
+            array.array("d", [chunk.offset for chunk in chunks]),
+            array.array("d", [chunk.duration for chunk in chunks]),
+            [chunk.lang for chunk in chunks],
+        )
+
+
+@_with_from_dict
+@dataclass(slots=True)
 class TranslatedTranscript:
     """A translated video transcript.
 
@@ -70,7 +188,7 @@ class TranslatedTranscript:
         lang: ISO 639-1 language code of translation
     """
 
-    content: Union[List[TranscriptChunk], str] = None
+    content: Union[List[TranscriptChunk], str] = field(default_factory=list)
     lang: str = ""
 
     def __post_init__(self):
@@ -78,7 +196,8 @@ class TranslatedTranscript:
             self.content = []
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class Scrape:
     """Scraped web content.
 
@@ -98,14 +217,15 @@ class Scrape:
     description: str = ""
     og_url: Optional[str] = None
     count_characters: int = 0
-    urls: List[str] = None
+    urls: List[str] = field(default_factory=list)
 
     def __post_init__(self):
         if self.urls is None:
             self.urls = []
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class Map:
     """A site map containing URLs.
 
@@ -113,14 +233,15 @@ class Map:
         urls: List of URLs found on the webpage
     """
 
-    urls: List[str] = None
+    urls: List[str] = field(default_factory=list)
 
     def __post_init__(self):
         if self.urls is None:
             self.urls = []
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class CrawlPage:
     """A page from a crawl job.
 
@@ -141,7 +262,8 @@ class CrawlPage:
     count_characters: int = 0
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class CrawlResponse:
     """Response from a crawl job.
 
@@ -156,7 +278,8 @@ class CrawlResponse:
     next: Optional[str] = None
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class CrawlJob:
     """A new crawl job.
 
@@ -167,7 +290,8 @@ class CrawlJob:
     job_id: str
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class ExtractJob:
     """Response from starting an extract job.
 
@@ -178,7 +302,8 @@ class ExtractJob:
     job_id: str
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class ExtractResult:
     """Result from an extract job.
 
@@ -195,7 +320,6 @@ class ExtractResult:
     schema: Optional[dict] = None
 
 
-@dataclass
 class YoutubeChannelBaseDict(TypedDict):
     """YouTube Channel dict
 
@@ -209,7 +333,13 @@ class YoutubeChannelBaseDict(TypedDict):
     name: str
 
 
-@dataclass
+def _empty_channel() -> YoutubeChannelBaseDict:
+    """Return a fresh placeholder channel for results without channel data."""
+    return YoutubeChannelBaseDict(id="", name="")
+
+
+@_with_from_dict
+@dataclass(slots=True)
 class YoutubeVideo:
     """YouTube video details.
 
@@ -229,26 +359,28 @@ class YoutubeVideo:
     title: str = ""
     description: str = ""
     duration: int = 0
-    channel: YoutubeChannelBaseDict = None
-    tags: List[str] = None
+    channel: YoutubeChannelBaseDict = field(default_factory=_empty_channel)
+    tags: List[str] = field(default_factory=list)
     thumbnail: str = ""
-    uploaded_date: datetime = None
+    uploaded_date: datetime = field(default_factory=datetime.now)
     view_count: int = 0
     like_count: int = 0
-    transcript_languages: List[str] = None
+    transcript_languages: List[str] = field(default_factory=list)
 
     def __post_init__(self):
-        if self.channel is None:
-            self.channel = YoutubeChannelBaseDict(id="", name="")
+        # A null or malformed channel becomes the empty placeholder
+        if not isinstance(self.channel, dict):
+            self.channel = _empty_channel()
         if self.tags is None:
             self.tags = []
-        if self.uploaded_date is None:
-            self.uploaded_date = datetime.now()
         if self.transcript_languages is None:
             self.transcript_languages = []
+        if self.uploaded_date is None:
+            self.uploaded_date = datetime.now()
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class YoutubeChannel:
     """YouTube Channel Details
 
@@ -273,7 +405,8 @@ class YoutubeChannel:
     banner: str = ""
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class YoutubePlaylist:
     """Youtube Playlist Details
 
@@ -291,18 +424,19 @@ class YoutubePlaylist:
     title: str = ""
     video_count: int = 0
     view_count: int = 0
-    last_updated: datetime = None
-    channel: YoutubeChannelBaseDict = None
+    last_updated: datetime = field(default_factory=datetime.now)
+    channel: YoutubeChannelBaseDict = field(default_factory=_empty_channel)
     description: Optional[str] = None
 
     def __post_init__(self):
         if self.last_updated is None:
             self.last_updated = datetime.now()
-        if self.channel is None:
-            self.channel = YoutubeChannelBaseDict(id="", name="")
+        if not isinstance(self.channel, dict):
+            self.channel = _empty_channel()
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class VideoIds:
     """Container for YouTube video IDs.
     
@@ -312,10 +446,10 @@ class VideoIds:
         live_ids: List of YouTube Live IDs
     """
     
-    video_ids: List[str] = None
-    short_ids: List[str] = None
-    live_ids: List[str] = None
-    
+    video_ids: List[str] = field(default_factory=list)
+    short_ids: List[str] = field(default_factory=list)
+    live_ids: List[str] = field(default_factory=list)
+
     def __post_init__(self):
         if self.video_ids is None:
             self.video_ids = []
@@ -325,7 +459,8 @@ class VideoIds:
             self.live_ids = []
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class BatchJob:
     """Response containing the ID of a newly created batch job.
 
@@ -336,7 +471,8 @@ class BatchJob:
     job_id: str
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class BatchResultItem:
     """Represents a single result item within a batch job.
 
@@ -353,7 +489,8 @@ class BatchResultItem:
     error_code: Optional[str] = None
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class BatchStats:
     """Statistics for a completed batch job.
 
@@ -368,7 +505,28 @@ class BatchStats:
     failed: int = 0
 
 
-@dataclass
+def _batch_result_item(item: dict) -> BatchResultItem:
+    """Build a BatchResultItem and its nested transcript or video from a result dict."""
+    transcript_data = item.get('transcript')
+    transcript = Transcript.from_dict(transcript_data) if transcript_data and isinstance(transcript_data, dict) else None
+
+    video = None
+    video_data = item.get('video')
+    if video_data and isinstance(video_data, dict):
+        # Only build the fallback timestamp when the date is missing or invalid
+        raw_upload_date = video_data.pop("upload_date", None)
+        try:
+            uploaded_time = _parse_iso(raw_upload_date) if raw_upload_date else datetime.now()
+        except (ValueError, TypeError):
+            uploaded_time = datetime.now()
+        video_data["uploaded_date"] = uploaded_time
+        video = YoutubeVideo.from_dict(video_data)
+
+    return BatchResultItem(item.get('video_id', ''), transcript, video, item.get('error_code'))
+
+
+@_with_from_dict
+@dataclass(slots=True)
 class BatchResults:
     """Represents the complete results of a batch job.
 
@@ -388,53 +546,32 @@ class BatchResults:
         # Attempt to parse completed_at if it's a string
         if isinstance(self.completed_at, str):
             try:
-                self.completed_at = datetime.fromisoformat(self.completed_at.replace('Z', '+00:00'))
+                self.completed_at = _parse_iso(self.completed_at)
             except ValueError:
                 self.completed_at = None # Handle potential parsing errors
         
-        # Process results into BatchResultItem objects
-        processed_results = []
+        # Process results into BatchResultItem objects in a single pass
         if isinstance(self.results, list):
-            for item in self.results:
-                 if isinstance(item, dict):
-                    # Determine if it's a transcript or video result based on keys
-                    transcript_data = item.get('transcript')
-                    video_data = item.get('video')
-                    
-                    transcript_obj = None
-                    if transcript_data and isinstance(transcript_data, dict):
-                       transcript_obj = Transcript(**transcript_data)
-
-                    video_obj = None
-                    if video_data and isinstance(video_data, dict):
-                        # Handle potential date parsing issues for video upload_date
-                        try:
-                            uploaded_time = datetime.fromisoformat(video_data.pop("upload_date", datetime.now().isoformat()))
-                        except (ValueError, TypeError):
-                            uploaded_time = datetime.now()
-                        video_obj = YoutubeVideo(**video_data, uploaded_date=uploaded_time)
-
-                    # Explicitly get values before creating the object
-                    # Use 'video_id' (snake_case) as the key might be auto-converted by dataclass init
-                    current_video_id = item.get('video_id', '')
-                    current_error_code = item.get('error_code') # Assuming this might also be converted
-
-                    processed_results.append(
-                        BatchResultItem(
-                            video_id=current_video_id,
-                            transcript=transcript_obj,
-                            video=video_obj,
-                            error_code=current_error_code
-                        )
-                    )
-        self.results = processed_results
+            self.results = [
+                _batch_result_item(item) if isinstance(item, dict) else item
+                for item in self.results
+                if isinstance(item, (dict, BatchResultItem))
+            ]
+        else:
+            self.results = []
 
         # Process stats into BatchStats object
         if isinstance(self.stats, dict):
-            self.stats = BatchStats(**self.stats)
+            self.stats = BatchStats.from_dict(self.stats)
 
+    @classmethod
+    def construct(cls, **values) -> "BatchResults":
+        """Build a BatchResults from already-normalized values, skipping ``__post_init__``."""
+        return _construct(cls, values)
 
-@dataclass
+
+@_with_from_dict
+@dataclass(slots=True)
 class YoutubeSearchResult:
     """A single YouTube search result.
     
@@ -456,22 +593,23 @@ class YoutubeSearchResult:
     duration: int = 0
     view_count: int = 0
     upload_date: Optional[datetime] = None
-    channel: YoutubeChannelBaseDict = None
+    channel: YoutubeChannelBaseDict = field(default_factory=_empty_channel)
     description: str = ""
     type: str = ""
     
     def __post_init__(self):
-        if self.channel is None:
-            self.channel = YoutubeChannelBaseDict(id="", name="")
+        if not isinstance(self.channel, dict):
+            self.channel = _empty_channel()
         # Parse upload_date if it's a string
         if isinstance(self.upload_date, str):
             try:
-                self.upload_date = datetime.fromisoformat(self.upload_date.replace('Z', '+00:00'))
+                self.upload_date = _parse_iso(self.upload_date)
             except ValueError:
                 self.upload_date = None
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class YoutubeSearchResponse:
     """Response from YouTube search endpoint.
 
@@ -491,14 +629,14 @@ class YoutubeSearchResponse:
         if isinstance(self.results, list):
             for item in self.results:
                 if isinstance(item, dict):
-                    filtered_item = filter_dict_for_dataclass(item, YoutubeSearchResult)
-                    processed_results.append(YoutubeSearchResult(**filtered_item))
+                    processed_results.append(YoutubeSearchResult.from_dict(item))
                 elif isinstance(item, YoutubeSearchResult):
                     processed_results.append(item)
         self.results = processed_results
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class MetadataAuthor:
     """Author information for media metadata.
 
@@ -515,7 +653,8 @@ class MetadataAuthor:
     verified: bool = False
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class MetadataStats:
     """Statistics for media metadata.
 
@@ -532,7 +671,8 @@ class MetadataStats:
     shares: Optional[int] = None
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class MetadataVideoInfo:
     """Video-specific metadata information.
 
@@ -551,7 +691,8 @@ class MetadataVideoInfo:
     thumbnail: Optional[str] = None
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class MetadataImageInfo:
     """Image-specific metadata information.
 
@@ -566,7 +707,8 @@ class MetadataImageInfo:
     height: Optional[int] = None
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class MetadataCarouselItem:
     """Item in a carousel/gallery.
 
@@ -582,12 +724,13 @@ class MetadataCarouselItem:
 
     def __post_init__(self):
         if isinstance(self.video, dict):
-            self.video = MetadataVideoInfo(**self.video)
+            self.video = MetadataVideoInfo.from_dict(self.video)
         if isinstance(self.image, dict):
-            self.image = MetadataImageInfo(**self.image)
+            self.image = MetadataImageInfo.from_dict(self.image)
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class MetadataMedia:
     """Media information for metadata.
 
@@ -611,17 +754,18 @@ class MetadataMedia:
 
     def __post_init__(self):
         if isinstance(self.video, dict):
-            self.video = MetadataVideoInfo(**self.video)
+            self.video = MetadataVideoInfo.from_dict(self.video)
         if isinstance(self.image, dict):
-            self.image = MetadataImageInfo(**self.image)
+            self.image = MetadataImageInfo.from_dict(self.image)
         if isinstance(self.carousel, list):
             self.carousel = [
-                item if isinstance(item, MetadataCarouselItem) else MetadataCarouselItem(**item)
+                MetadataCarouselItem.from_dict(item) if isinstance(item, dict) else item
                 for item in self.carousel
             ]
 
 
-@dataclass
+@_with_from_dict
+@dataclass(slots=True)
 class Metadata:
     """Metadata for media from supported platforms.
 
@@ -655,13 +799,18 @@ class Metadata:
 
     def __post_init__(self):
         if isinstance(self.author, dict):
-            self.author = MetadataAuthor(**self.author)
+            self.author = MetadataAuthor.from_dict(self.author)
         if isinstance(self.stats, dict):
-            self.stats = MetadataStats(**self.stats)
+            self.stats = MetadataStats.from_dict(self.stats)
         if isinstance(self.media, dict):
-            self.media = MetadataMedia(**self.media)
+            self.media = MetadataMedia.from_dict(self.media)
         if isinstance(self.created_at, str):
             try:
-                self.created_at = datetime.fromisoformat(self.created_at.replace('Z', '+00:00'))
+                self.created_at = _parse_iso(self.created_at)
             except ValueError:
                 self.created_at = None
+
+    @classmethod
+    def construct(cls, **values) -> "Metadata":
+        """Build a Metadata from already-normalized values, skipping ``__post_init__``."""
+        return _construct(cls, values)
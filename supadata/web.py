@@ -1,8 +1,48 @@
 """Web-related operations for Supadata."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from .types import Scrape, Map, CrawlJob, CrawlResponse, CrawlPage
 from .errors import SupadataError
-from typing import Optional, List, Dict, Union
+from typing import Any, Iterable, Iterator, Optional, List, Dict, Tuple, Union
+
+
+def _crawl_body(url: str, limit: Optional[int]) -> Dict[str, Union[str, int]]:
+    """Build the request body for starting a crawl job."""
+    data: Dict[str, Union[str, int]] = {"url": url}
+    if limit is not None:
+        data["limit"] = limit
+    return data
+
+
+def _crawl_pages(response: Dict[str, Any]) -> Tuple[List[CrawlPage], Optional[str]]:
+    """Build the CrawlPages of one page of crawl results.
+
+    Returns:
+        Tuple of (pages, token for the next page of results or None)
+
+    Raises:
+        SupadataError: If the crawl job failed
+    """
+    crawl_response = CrawlResponse.from_dict(response)
+
+    # Check if the job failed
+    if crawl_response.status == "failed":
+        raise SupadataError(error="crawl-failed", message="Crawl job failed", details="The crawl job failed to complete")
+
+    # Convert each page dict to a CrawlPage object
+    pages = [
+        CrawlPage(
+            url=page.get('url', ''),
+            content=page.get('content', ''),
+            name=page.get('name', ''),
+            description=page.get('description', ''),
+            og_url=page.get('og_url', None),
+            count_characters=page.get('count_characters', 0),
+        )
+        for page in crawl_response.pages or ()
+    ]
+    return pages, crawl_response.next
 
 
 class Web:
@@ -29,7 +69,27 @@ class Web:
             SupadataError: If the API request fails
         """
         response = self._request("GET", "/web/scrape", params={"url": url})
-        return Scrape(**response)
+        return Scrape.from_dict(response)
+
+    def scrape_many(self, urls: Iterable[str], concurrency: int = 16) -> List[Scrape]:
+        """Scrape several web pages concurrently.
+
+        Requests run on a thread pool and share the client's connection pool, so
+        keep ``concurrency`` at or below the client's ``pool_size`` to avoid
+        opening extra connections.
+
+        Args:
+            urls: URLs to scrape
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List of Scrape objects, in the same order as ``urls``
+
+        Raises:
+            SupadataError: If any of the API requests fails
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(self.scrape, urls))
 
     def map(self, url: str) -> Map:
         """Generate a site map for a website.
@@ -44,7 +104,7 @@ class Web:
             SupadataError: If the API request fails
         """
         response = self._request("GET", "/web/map", params={"url": url})
-        return Map(**response)
+        return Map.from_dict(response)
 
     def crawl(self, url: str, limit: Optional[int] = None) -> CrawlJob:
         """Start a new crawl job.
@@ -59,12 +119,8 @@ class Web:
         Raises:
             SupadataError: If the crawl job failed
         """
-        data: Dict[str, Union[str, int]] = {"url": url}
-        if limit is not None:
-            data["limit"] = limit
-            
-        response = self._request("POST", "/web/crawl", json=data)
-        return CrawlJob(**response)
+        response = self._request("POST", "/web/crawl", json=_crawl_body(url, limit))
+        return CrawlJob.from_dict(response)
 
     def get_crawl_results(self, job_id: str) -> List[CrawlPage]:
         """Get the results of a crawl job.
@@ -80,36 +136,31 @@ class Web:
         Raises:
             SupadataError: If the crawl job failed
         """
-        all_pages = []
+        return list(self.iter_crawl_results(job_id))
+
+    def iter_crawl_results(self, job_id: str) -> Iterator[CrawlPage]:
+        """Iterate over the results of a crawl job.
+
+        Pages are yielded as each page of results is fetched, and the next page
+        is only requested once the previous one has been consumed, so large
+        crawls never have to be held in memory at once.
+
+        Args:
+            job_id: ID of the crawl job
+
+        Yields:
+            CrawlPage objects containing the crawled content
+
+        Raises:
+            SupadataError: If the crawl job failed
+        """
         next_token = None
 
         while True:
-            params = {}
-            if next_token:
-                params["next"] = next_token
-
+            params = {"next": next_token} if next_token else {}
             response = self._request("GET", f"/web/crawl/{job_id}", params=params)
-            crawl_response = CrawlResponse(**response)
-
-            # Check if the job failed
-            if crawl_response.status == "failed":
-                raise SupadataError(error="crawl-failed", message="Crawl job failed", details="The crawl job failed to complete")
-
-            if crawl_response.pages:
-                # Convert each page dict to a CrawlPage object
-                for page in crawl_response.pages:
-                    page_data = {
-                        'url': page.get('url', ''),
-                        'content': page.get('content', ''),
-                        'name': page.get('name', ''),
-                        'description': page.get('description', ''), 
-                        'og_url': page.get('og_url', None),
-                        'count_characters': page.get('count_characters', 0)
-                    }
-                    all_pages.append(CrawlPage(**page_data))
-
-            if not crawl_response.next:
-                break
-            next_token = crawl_response.next
+            pages, next_token = _crawl_pages(response)
+            yield from pages
 
-        return all_pages 
\ No newline at end of file
+            if not next_token:
+                break
@@ -1,8 +1,13 @@
 """YouTube-related operations for Supadata."""
 
+import functools
+import threading
+import time
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Literal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Literal, Tuple, Union
 
 from .errors import SupadataError
 from .types import (
@@ -16,25 +21,138 @@ from .types import (
     BatchJob,
     BatchResults,
     YoutubeSearchResponse,
+    _parse_iso,
+    _transcript_chunk,
 )
 
-# Forward declare YouTube for type hints in private classes
-class YouTube:
-    pass
+
+def _transcript_content(content: Any, text: bool) -> Union[List[TranscriptChunk], str]:
+    """Normalize transcript content from the API into chunks or plain text."""
+    if text:
+        return content if isinstance(content, str) else ""
+    return [_transcript_chunk(chunk) for chunk in content] if isinstance(content, list) else []
+
+
+# Clock and sleep used by the cache and batch polling; module-level so tests can
+# replace them here without patching the global time module
+_monotonic = time.monotonic
+_sleep = time.sleep
+
+
+class _TTLCache:
+    """A small thread-safe LRU cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= _monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (_monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_BATCH_DONE_STATUSES = frozenset({"completed", "failed"})
+_BACKOFF_FACTOR = 1.6
+
+
+def _batch_timeout_error(job_id: str, timeout: float) -> SupadataError:
+    """Build the error raised when polling a batch job times out."""
+    return SupadataError(
+        error="batch-timeout",
+        message="Batch Timeout",
+        details=f"Batch job {job_id} did not finish within {timeout} seconds",
+    )
+
+
+def _poll_deadline(timeout: float) -> float:
+    """Return the clock reading at which batch polling gives up."""
+    return _monotonic() + timeout
+
+
+def _poll_delay(deadline: float, delay: float, job_id: str, timeout: float) -> float:
+    """Return the wait before the next batch poll, raising once the deadline has passed."""
+    remaining = deadline - _monotonic()
+    if remaining <= 0:
+        raise _batch_timeout_error(job_id, timeout)
+    return min(delay, remaining)
+
+
+def _channel_from_response(response: dict, id: str) -> YoutubeChannel:
+    """Build a YoutubeChannel from a /youtube/channel response."""
+    # Missing fields take the dataclass defaults in from_dict
+    response.setdefault("id", id)
+    return YoutubeChannel.from_dict(response)
+
+
+def _playlist_from_response(response: dict, id: str) -> YoutubePlaylist:
+    """Build a YoutubePlaylist from a /youtube/playlist response."""
+    raw_last_updated = response.pop("last_updated", None)
+    try:
+        last_updated = _parse_iso(raw_last_updated) if raw_last_updated else datetime.now()
+    except (ValueError, TypeError):
+        last_updated = datetime.now()
+
+    # Missing fields take the dataclass defaults in from_dict; only the id
+    # falls back to the requested one
+    response.setdefault("id", id)
+
+    response["last_updated"] = last_updated
+    return YoutubePlaylist.from_dict(response)
+
+
+def _video_from_response(response: dict, id: str) -> YoutubeVideo:
+    """Build a YoutubeVideo from a /youtube/video response."""
+    raw_upload_date = response.pop("upload_date", None)
+    try:
+        uploaded_time = _parse_iso(raw_upload_date) if raw_upload_date else datetime.now()
+    except (ValueError, TypeError):
+        uploaded_time = datetime.now()
+
+    # Missing fields take the dataclass defaults in from_dict; only the id
+    # falls back to the requested one
+    response.setdefault("id", id)
+
+    response["uploaded_date"] = uploaded_time
+    return YoutubeVideo.from_dict(response)
+
 
 # --------------------------------------------------------------------------
 # Private Classes for API Namespaces
 # --------------------------------------------------------------------------
 
 class _Channel:
+    __slots__ = ("_youtube",)
+
     def __init__(self, youtube: "YouTube"):
         self._youtube = youtube
 
-    def __call__(self, id: str) -> YoutubeChannel:
+    def __call__(self, id: str, cache: bool = True) -> YoutubeChannel:
         """Get the channel metadata for a YouTube Channel.
 
         Args:
             id: YouTube Channel ID, URL, or handle (@username)
+            cache: Use the lookup cache if one is configured; pass False to skip
+                both reading and storing a cached result.
 
         Returns:
             YoutubeChannel object containing the metadata.
@@ -42,18 +160,13 @@ class _Channel:
         Raises:
             SupadataError: If the API request fails.
         """
+        return self._youtube._cached(("channel", id), self._fetch, id, cache=cache)
+
+    def _fetch(self, id: str) -> YoutubeChannel:
         response: dict = self._youtube._request(
             "GET", "/youtube/channel", params={"id": id}
         )
-
-        defaults = {
-            "id": id, "name": "", "handle": "", "description": "",
-            "subscriber_count": 0, "video_count": 0, "thumbnail": "", "banner": ""
-        }
-        for key, default_value in defaults.items():
-            if key not in response:
-                response[key] = default_value
-        return YoutubeChannel(**response)
+        return _channel_from_response(response, id)
 
     def videos(
         self, id: str, limit: Optional[int] = None, type: Literal["all", "video", "short", "live"] = "all"
@@ -88,14 +201,18 @@ class _Channel:
 
 
 class _Playlist:
+    __slots__ = ("_youtube",)
+
     def __init__(self, youtube: "YouTube"):
         self._youtube = youtube
 
-    def __call__(self, id: str) -> YoutubePlaylist:
+    def __call__(self, id: str, cache: bool = True) -> YoutubePlaylist:
         """Gets the playlist metadata for a YouTube public playlist.
 
         Args:
             id: YouTube playlist ID or URL.
+            cache: Use the lookup cache if one is configured; pass False to skip
+                both reading and storing a cached result.
 
         Returns:
             YoutubePlaylist object containing the metadata.
@@ -103,26 +220,13 @@ class _Playlist:
         Raises:
             SupadataError: If the API request fails.
         """
+        return self._youtube._cached(("playlist", id), self._fetch, id, cache=cache)
+
+    def _fetch(self, id: str) -> YoutubePlaylist:
         response: dict = self._youtube._request(
             "GET", "/youtube/playlist", params={"id": id}
         )
-
-        try:
-            last_updated = datetime.fromisoformat(response.pop("last_updated", datetime.now().isoformat()))
-        except (ValueError, TypeError):
-            last_updated = datetime.now()
-
-        defaults = {
-            "id": id, "title": "", "video_count": 0, "view_count": 0,
-            "channel": {"id": "", "name": ""}, "description": None
-        }
-        for key, default_value in defaults.items():
-            if key not in response:
-                response[key] = default_value
-            elif key == "channel" and not isinstance(response[key], dict):
-                response[key] = defaults[key]
-
-        return YoutubePlaylist(**response, last_updated=last_updated)
+        return _playlist_from_response(response, id)
 
     def videos(self, id: str, limit: Optional[int] = None) -> VideoIds:
         """Get video IDs from a YouTube playlist.
@@ -155,10 +259,12 @@ class _Playlist:
 
 
 class _Video:
+    __slots__ = ("_youtube",)
+
     def __init__(self, youtube: "YouTube"):
         self._youtube = youtube
 
-    def __call__(self, id: str) -> YoutubeVideo:
+    def __call__(self, id: str, cache: bool = True) -> YoutubeVideo:
         """Get the video metadata for a YouTube video.
 
         .. deprecated::
@@ -166,6 +272,8 @@ class _Video:
 
         Args:
             id: YouTube video ID or URL.
+            cache: Use the lookup cache if one is configured; pass False to skip
+                both reading and storing a cached result.
 
         Returns:
             YoutubeVideo object containing the metadata.
@@ -178,25 +286,11 @@ class _Video:
             DeprecationWarning,
             stacklevel=2
         )
-        response: dict = self._youtube._request("GET", "/youtube/video", params={"id": id})
+        return self._youtube._cached(("video", id), self._fetch, id, cache=cache)
 
-        try:
-            uploaded_time = datetime.fromisoformat(response.pop("upload_date", datetime.now().isoformat()))
-        except (ValueError, TypeError):
-            uploaded_time = datetime.now()
-
-        defaults = {
-            "id": id, "title": "", "description": "", "duration": 0,
-            "channel": {"id": "", "name": ""}, "tags": [], "thumbnail": "",
-            "view_count": 0, "like_count": 0, "transcript_languages": []
-        }
-        for key, default_value in defaults.items():
-            if key not in response:
-                response[key] = default_value
-            elif key == "channel" and not isinstance(response[key], dict):
-                response[key] = defaults[key]
-
-        return YoutubeVideo(**response, uploaded_date=uploaded_time)
+    def _fetch(self, id: str) -> YoutubeVideo:
+        response: dict = self._youtube._request("GET", "/youtube/video", params={"id": id})
+        return _video_from_response(response, id)
 
     def batch(
         self,
@@ -230,10 +324,14 @@ class _Video:
 
 
 class _Transcript:
+    __slots__ = ("_youtube",)
+
     def __init__(self, youtube: "YouTube"):
         self._youtube = youtube
 
-    def __call__(self, video_id: str, lang: str = None, text: bool = False) -> Transcript:
+    def __call__(
+        self, video_id: str, lang: str = None, text: bool = False, cache: bool = True
+    ) -> Transcript:
         """Get transcript for a YouTube video.
 
         .. deprecated::
@@ -243,6 +341,8 @@ class _Transcript:
             video_id: YouTube video ID or URL.
             lang: Language code for preferred transcript (e.g., 'es'). Optional.
             text: Return plain text instead of segments. Default False.
+            cache: Use the lookup cache if one is configured; pass False to skip
+                both reading and storing a cached result.
 
         Returns:
             Transcript object containing content, language, and available languages.
@@ -255,28 +355,22 @@ class _Transcript:
             DeprecationWarning,
             stacklevel=2
         )
-        params = {"videoId": video_id, "text": str(text).lower()}
+        return self._youtube._cached(
+            ("transcript", video_id, lang, bool(text)), self._fetch, video_id, lang, text, cache=cache
+        )
+
+    def _fetch(self, video_id: str, lang: Optional[str], text: bool) -> Transcript:
+        params = {"videoId": video_id, "text": "true" if text else "false"}
         if lang:
             params["lang"] = lang
 
         response = self._youtube._request("GET", "/youtube/transcript", params=params)
 
-        content = response.get("content")
-        if not text:
-            processed_content = [
-                TranscriptChunk(**chunk) for chunk in content
-            ] if isinstance(content, list) else []
-        else:
-            processed_content = content if isinstance(content, str) else ""
-
         # Ensure defaults for optional return fields
-        response_lang = response.get("lang", "")
-        response_available = response.get("available_langs", [])
-
         return Transcript(
-            content=processed_content,
-            lang=response_lang,
-            available_langs=response_available
+            _transcript_content(response.get("content"), text),
+            response.get("lang", ""),
+            response.get("available_langs", []),
         )
 
     def translate(self, video_id: str, lang: str, text: bool = False) -> TranslatedTranscript:
@@ -296,21 +390,14 @@ class _Transcript:
         response = self._youtube._request(
             "GET",
             "/youtube/transcript/translate",
-            params={"videoId": video_id, "lang": lang, "text": str(text).lower()},
+            params={"videoId": video_id, "lang": lang, "text": "true" if text else "false"},
         )
 
-        content = response.get("content")
-        if not text:
-             processed_content = [
-                TranscriptChunk(**chunk) for chunk in content
-            ] if isinstance(content, list) else []
-        else:
-            processed_content = content if isinstance(content, str) else ""
-
         # Ensure target language is set even if API omits it
-        response_lang = response.get("lang", lang)
-
-        return TranslatedTranscript(content=processed_content, lang=response_lang)
+        return TranslatedTranscript(
+            _transcript_content(response.get("content"), text),
+            response.get("lang", lang),
+        )
 
     def batch(
         self,
@@ -348,14 +435,18 @@ class _Transcript:
         )
 
 class _Batch:
+    __slots__ = ("_youtube",)
+
     def __init__(self, youtube: "YouTube"):
         self._youtube = youtube
 
-    def get_batch_results(self, job_id: str) -> BatchResults:
+    def get_batch_results(self, job_id: str, cache: bool = True) -> BatchResults:
         """Get the status and results of a batch job.
 
         Args:
             job_id: The ID of the batch job.
+            cache: Use the lookup cache if one is configured; pass False to skip
+                both reading and storing a cached result.
 
         Returns:
             BatchResults object containing status, results, and stats.
@@ -363,11 +454,70 @@ class _Batch:
         Raises:
             SupadataError: If the API request fails.
         """
+        store = self._youtube._cache if cache else None
+        key = ("batch", job_id)
+        if store is not None:
+            results = store.get(key)
+            if results is not None:
+                return results
+
         response = self._youtube._request("GET", f"/youtube/batch/{job_id}")
-        
-        # Reverted: Pass raw response directly to BatchResults constructor.
-        # The BatchResults.__post_init__ method in types.py will handle parsing.
-        return BatchResults(**response)
+        results = BatchResults.from_dict(response)
+        # Only finished jobs are cached; queued or active ones must be polled again
+        if store is not None and results.status in _BATCH_DONE_STATUSES:
+            store.set(key, results)
+        return results
+
+    def get_batch_results_many(self, job_ids: Iterable[str], concurrency: int = 16) -> List[BatchResults]:
+        """Get the status and results of several batch jobs concurrently.
+
+        Args:
+            job_ids: IDs of the batch jobs.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            List of BatchResults objects, in the same order as ``job_ids``.
+
+        Raises:
+            SupadataError: If any of the API requests fails.
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(self.get_batch_results, job_ids))
+
+    def poll_until_done(
+        self,
+        job_id: str,
+        timeout: float = 600,
+        initial_delay: float = 0.5,
+        max_delay: float = 30,
+    ) -> BatchResults:
+        """Poll a batch job until it completes or fails.
+
+        The wait between polls starts at ``initial_delay`` and grows
+        exponentially up to ``max_delay``, so short jobs return quickly while
+        long jobs are not polled more often than needed.
+
+        Args:
+            job_id: The ID of the batch job.
+            timeout: Maximum number of seconds to wait.
+            initial_delay: Seconds to wait after the first unfinished poll.
+            max_delay: Upper bound for the wait between polls.
+
+        Returns:
+            BatchResults object with status 'completed' or 'failed'.
+
+        Raises:
+            SupadataError: If the API request fails or the job does not finish
+                within ``timeout`` seconds.
+        """
+        deadline = _poll_deadline(timeout)
+        delay = initial_delay
+        while True:
+            results = self.get_batch_results(job_id)
+            if results.status in _BATCH_DONE_STATUSES:
+                return results
+            _sleep(_poll_delay(deadline, delay, job_id, timeout))
+            delay = min(delay * _BACKOFF_FACTOR, max_delay)
 
 
 # --------------------------------------------------------------------------
@@ -384,7 +534,40 @@ class YouTube:
             request_handler: Internal request handler from main client.
         """
         self._request = request_handler
-        # No caching of private class instances
+        self._cache: Optional[_TTLCache] = None
+
+    def configure_cache(self, maxsize: int = 1024, ttl: float = 300) -> None:
+        """Cache channel, playlist, video and transcript lookups between calls.
+
+        Repeated lookups with the same arguments within ``ttl`` seconds return
+        the cached object without another API request. Batch results are cached
+        too, but only once the job has completed or failed. Cached objects are
+        shared between callers, so treat them as read-only. Caching is disabled
+        by default.
+
+        Args:
+            maxsize: Maximum number of cached objects; 0 disables caching.
+            ttl: Seconds a cached object stays valid.
+        """
+        self._cache = _TTLCache(maxsize, ttl) if maxsize > 0 else None
+
+    def cache_clear(self) -> None:
+        """Drop all cached objects, keeping the cache configuration."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _cached(self, key: tuple, fetch: Callable[..., Any], *args: Any, cache: bool = True) -> Any:
+        """Return the cached object for key, calling fetch(*args) on a miss.
+
+        With ``cache=False`` the cache is neither read nor updated.
+        """
+        if self._cache is None or not cache:
+            return fetch(*args)
+        value = self._cache.get(key)
+        if value is None:
+            value = fetch(*args)
+            self._cache.set(key, value)
+        return value
 
     # --- Validation and Core Helpers ---
 
@@ -392,7 +575,8 @@ class YouTube:
         """Validate the limit parameter."""
         if limit is None:
             return
-        if not isinstance(limit, int) or limit <= 0 or limit > 5000:
+        # bool is an int subclass, but True/False are not meaningful limits
+        if isinstance(limit, bool) or not isinstance(limit, int) or limit <= 0 or limit > 5000:
             raise SupadataError(
                 error="invalid-request",
                 message="Invalid limit provided.",
@@ -407,46 +591,34 @@ class YouTube:
         limit: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Validate batch source parameters and construct the payload."""
-        payload = {}
-        sources = 0
-        if video_ids:
-            payload["videoIds"] = video_ids
-            sources += 1
-        if playlist_id:
-            payload["playlistId"] = playlist_id
-            sources += 1
-        if channel_id:
-            payload["channelId"] = channel_id
-            sources += 1
-
-        if sources == 0:
+        sources = [
+            (key, value)
+            for key, value in (("videoIds", video_ids), ("playlistId", playlist_id), ("channelId", channel_id))
+            if value
+        ]
+        if not sources:
             raise SupadataError(
                 error="invalid-request", message="Missing source.",
                 details="One of video_ids, playlist_id, or channel_id must be provided."
             )
-        if sources > 1:
+        if len(sources) > 1:
             raise SupadataError(
                 error="invalid-request", message="Multiple sources.",
                 details="Only one of video_ids, playlist_id, or channel_id can be provided."
             )
 
+        payload = dict(sources)
         if limit is not None:
             self._validate_limit(limit)
-            # Only add limit if source is playlist or channel
-            if playlist_id or channel_id:
-                 payload["limit"] = limit
-            elif video_ids and limit is not None:
-                 # Optionally warn or ignore limit if only video_ids are provided?
-                 # Current behavior: limit is ignored by API if only video_ids are sent.
-                 pass
-
-
+            # The API ignores limit for explicit video_ids, so only send it for playlists and channels
+            if not video_ids:
+                payload["limit"] = limit
         return payload
 
     def _create_batch_job(self, endpoint: str, payload: dict) -> BatchJob:
         """Internal helper to create any batch job."""
         response = self._request("POST", endpoint, json=payload)
-        return BatchJob(**response)
+        return BatchJob.from_dict(response)
 
     # --- Batch Creation Helpers (used by private classes) ---
 
@@ -530,7 +702,7 @@ class YouTube:
             params["limit"] = limit
 
         response = self._request("GET", "/youtube/search", params=params)
-        return YoutubeSearchResponse(**response)
+        return YoutubeSearchResponse.from_dict(response)
 
     def translate(
         self, video_id: str, lang: str, text: bool = False
@@ -550,14 +722,13 @@ class YouTube:
         Raises:
             SupadataError: If the API request fails.
         """
-        # Creates a temporary _Transcript instance to perform the action
-        return _Transcript(self).translate(video_id, lang, text)
+        return self.transcript.translate(video_id, lang, text)
 
     # --------------------------------------------------------------------------
     # Public API (Properties returning callable/namespace objects)
     # --------------------------------------------------------------------------
 
-    @property
+    @functools.cached_property
     def channel(self) -> _Channel:
         """Access YouTube channel operations.
 
@@ -573,9 +744,9 @@ class YouTube:
         Returns:
             An object for channel operations.
         """
-        return _Channel(self) # Return a new instance each time
+        return _Channel(self)
 
-    @property
+    @functools.cached_property
     def playlist(self) -> _Playlist:
         """Access YouTube playlist operations.
 
@@ -590,9 +761,9 @@ class YouTube:
         Returns:
             An object for playlist operations.
         """
-        return _Playlist(self) # Return a new instance each time
+        return _Playlist(self)
 
-    @property
+    @functools.cached_property
     def video(self) -> _Video:
         """Access YouTube video operations.
 
@@ -608,9 +779,9 @@ class YouTube:
         Returns:
             An object for video operations.
         """
-        return _Video(self) # Return a new instance each time
+        return _Video(self)
 
-    @property
+    @functools.cached_property
     def transcript(self) -> _Transcript:
         """Access YouTube transcript operations.
 
@@ -627,9 +798,9 @@ class YouTube:
         Returns:
             An object for transcript operations.
         """
-        return _Transcript(self) # Return a new instance each time
+        return _Transcript(self)
 
-    @property
+    @functools.cached_property
     def batch(self) -> _Batch:
         """Access YouTube batch result operations.
 
@@ -643,5 +814,5 @@ class YouTube:
         Returns:
             An object for batch result operations.
         """
-        return _Batch(self) # Return a new instance each time
+        return _Batch(self)
 
@@ -1,10 +1,15 @@
 """Tests for the Supadata client."""
 
-from datetime import datetime
+import asyncio
+import pickle
+import re
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
 
 from supadata import (
+    AsyncSupadata,
     CrawlJob,
     CrawlPage,
     Map,
@@ -29,6 +34,7 @@ from supadata.types import (
     BatchStats,
     ExtractJob,
     ExtractResult,
+    VideoIds,
     YoutubeSearchResponse,
     YoutubeSearchResult,
 )
@@ -60,6 +66,15 @@ def test_client_initialization(api_key: str, base_url: str) -> None:
     assert client.session.headers["Accept"] == "application/json"
 
 
+def test_client_connection_pool(api_key: str, base_url: str) -> None:
+    """Test the session mounts a sized, retrying connection pool."""
+    client = Supadata(api_key=api_key, base_url=base_url, pool_size=8)
+    adapter = client.session.get_adapter(base_url)
+    assert adapter._pool_maxsize == 8
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+
+
 def test_get_transcript_chunks(client: Supadata, requests_mock) -> None:
     """Test getting transcript with chunks using universal endpoint."""
     url = "https://www.youtube.com/watch?v=test123"
@@ -78,6 +93,83 @@ def test_get_transcript_chunks(client: Supadata, requests_mock) -> None:
     assert transcript.available_langs == ["en", "es"]
 
 
+def test_transcript_chunks_ignore_unknown_fields(client: Supadata, requests_mock) -> None:
+    """Test new fields on transcript chunks do not break parsing."""
+    mock_response = {
+        "content": [
+            {"text": "Hello", "offset": 0, "duration": 1000, "lang": "en", "speaker": "A"}
+        ],
+        "lang": "en",
+    }
+    requests_mock.get(f"{client.base_url}/transcript", json=mock_response)
+
+    transcript = client.transcript(url="https://www.youtube.com/watch?v=test123")
+    assert transcript.content == [TranscriptChunk(text="Hello", offset=0, duration=1000, lang="en")]
+
+
+def test_transcript_chunks_missing_fields_use_defaults() -> None:
+    """Test chunks missing optional fields fall back to their defaults."""
+    transcript = Transcript(content=[{"text": "Hello", "offset": 0, "duration": 1000}])
+    assert transcript.content == [TranscriptChunk(text="Hello", offset=0, duration=1000, lang="")]
+
+
+def test_null_list_fields_become_empty(client: Supadata, requests_mock) -> None:
+    """Test explicit nulls for list fields are treated like missing fields."""
+    requests_mock.get(
+        f"{client.base_url}/transcript", json={"content": None, "lang": "en", "availableLangs": None}
+    )
+    requests_mock.get(
+        f"{client.base_url}/web/scrape", json={"url": "https://supadata.ai", "urls": None}
+    )
+    requests_mock.get(f"{client.base_url}/web/map", json={"urls": None})
+    requests_mock.get(
+        f"{client.base_url}/youtube/channel/videos",
+        json={"videoIds": None, "shortIds": None, "liveIds": None},
+    )
+
+    transcript = client.transcript(url="https://youtu.be/dQw4w9WgXcQ")
+    assert transcript.content == []
+    assert transcript.available_langs == []
+    assert client.web.scrape("https://supadata.ai").urls == []
+    assert client.web.map("https://supadata.ai").urls == []
+    assert client.youtube.channel.videos(id="UC1") == VideoIds()
+    assert YoutubeVideo.from_dict({"id": "v", "tags": None, "transcript_languages": None}).tags == []
+
+
+def test_transcript_construct() -> None:
+    """Test construct() builds from normalized values and fills defaults."""
+    chunks = [TranscriptChunk(text="Hello", offset=0, duration=1000, lang="en")]
+    transcript = Transcript.construct(content=chunks, lang="en")
+    assert transcript == Transcript(content=chunks, lang="en")
+    assert transcript.content is chunks
+    assert transcript.available_langs == []
+    assert Transcript(content=chunks).content is chunks
+
+    with pytest.raises(TypeError):
+        Metadata.construct(platform="youtube")
+
+
+def test_transcript_to_columns() -> None:
+    """Test splitting transcript chunks into columns."""
+    transcript = Transcript(content=[
+        {"text": "Hello", "offset": 0, "duration": 1000, "lang": "en"},
+        {"text": "world", "offset": 1000, "duration": 500, "lang": "en"},
+    ])
+    texts, offsets, durations, langs = transcript.to_columns()
+    assert texts == ["Hello", "world"]
+    assert list(offsets) == [0, 1000]
+    assert list(durations) == [1000, 500]
+    assert langs == ["en", "en"]
+
+    fractional = Transcript(content=[{"text": "a", "offset": 1.5, "duration": 2.25, "lang": "en"}])
+    _, offsets, durations, _ = fractional.to_columns()
+    assert list(offsets) == [1.5]
+    assert list(durations) == [2.25]
+
+    with pytest.raises(TypeError):
+        Transcript(content="Hello world").to_columns()
+
+
 def test_get_transcript_text(client: Supadata, requests_mock) -> None:
     """Test getting transcript as plain text using universal endpoint."""
     url = "https://www.youtube.com/watch?v=test123"
@@ -130,6 +222,28 @@ def test_scrape(client: Supadata, requests_mock) -> None:
     assert content.count_characters == 100
 
 
+def test_scrape_ignores_unknown_fields(client: Supadata, requests_mock) -> None:
+    """Test new top-level response fields do not break parsing."""
+    mock_response = {"url": "https://test.com", "name": "Test Page", "newField": 1}
+    requests_mock.get(f"{client.base_url}/web/scrape", json=mock_response)
+
+    content = client.web.scrape(url="https://test.com")
+    assert content == Scrape(url="https://test.com", name="Test Page")
+
+
+def test_scrape_many(client: Supadata, requests_mock) -> None:
+    """Test scraping several pages concurrently keeps input order."""
+    urls = [f"https://test.com/{i}" for i in range(5)]
+    requests_mock.get(
+        f"{client.base_url}/web/scrape",
+        json=lambda request, context: {"url": request.qs["url"][0], "name": "Page"},
+    )
+
+    pages = client.web.scrape_many(urls, concurrency=3)
+    assert all(isinstance(page, Scrape) for page in pages)
+    assert [page.url for page in pages] == urls
+
+
 def test_map(client: Supadata, requests_mock) -> None:
     """Test site mapping."""
     url = "https://test.com"
@@ -167,6 +281,76 @@ def test_error_handling(client: Supadata, requests_mock) -> None:
     assert error.documentation_url == error_response["documentationUrl"]
 
 
+def test_error_pickle_roundtrip() -> None:
+    """Test SupadataError survives pickling, e.g. across process pools."""
+    error = SupadataError(
+        error="limit-exceeded",
+        message="Limit Exceeded",
+        details="Too many requests",
+        documentation_url="https://docs.test.com/errors#limit-exceeded",
+    )
+
+    restored = pickle.loads(pickle.dumps(error))
+    assert restored == error
+    assert str(restored) == str(error)
+
+
+def test_response_types_use_slots() -> None:
+    """Test every response dataclass is slotted, so instances carry no __dict__."""
+    import dataclasses
+    import supadata.types
+
+    response_types = [
+        obj for obj in vars(supadata.types).values()
+        if isinstance(obj, type) and dataclasses.is_dataclass(obj)
+    ]
+    assert response_types
+    for cls in response_types:
+        assert "__slots__" in vars(cls), cls.__name__
+    assert not hasattr(TranscriptChunk(text="Hi", offset=0, duration=1, lang="en"), "__dict__")
+
+
+def test_known_response_keys() -> None:
+    """Test the static key table agrees with the generic key conversion."""
+    from supadata.client import _KNOWN_KEYS, _convert, _to_snake
+
+    for camel, snake in _KNOWN_KEYS.items():
+        assert _to_snake(camel) == snake
+    assert _convert("HTTPResponseCode") == "http_response_code"
+    assert _convert("already_snake") == "already_snake"
+
+
+def test_decode_without_orjson(client: Supadata, requests_mock, monkeypatch) -> None:
+    """Test responses decode with the stdlib json fallback."""
+    monkeypatch.setattr("supadata.client.orjson", None)
+    mock_response = {
+        "url": "https://test.com",
+        "ogUrl": "https://test.com/og.png",
+        "countCharacters": 100,
+        "urls": ["https://test.com/about"],
+    }
+    requests_mock.get(f"{client.base_url}/web/scrape", json=mock_response)
+
+    result = client.web.scrape(url="https://test.com")
+    assert result.og_url == "https://test.com/og.png"
+    assert result.count_characters == 100
+    assert result.urls == ["https://test.com/about"]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_request_body(client: Supadata, requests_mock, monkeypatch, use_orjson: bool) -> None:
+    """Test POST bodies are sent as JSON with or without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr("supadata.client.orjson", None)
+    requests_mock.post(f"{client.base_url}/web/crawl", json={"jobId": "job-1"})
+
+    client.web.crawl(url="https://test.com", limit=10)
+    request = requests_mock.last_request
+    assert request.json() == {"url": "https://test.com", "limit": 10}
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.headers["x-api-key"] == "test_api_key"
+
+
 def test_start_crawl(client: Supadata, requests_mock) -> None:
     """Test starting a crawl job."""
     url = "https://test.com"
@@ -222,6 +406,32 @@ def test_get_crawl_results(client: Supadata, requests_mock) -> None:
     assert pages[1].name == "Test Page 2"
 
 
+def test_iter_crawl_results_is_lazy(client: Supadata, requests_mock) -> None:
+    """Test crawl results are fetched one results page at a time."""
+    job_id = "test-job-123"
+    mock_response1 = {
+        "status": "completed",
+        "pages": [{"url": "https://test.com", "name": "Test Page 1"}],
+        "next": "page2",
+    }
+    mock_response2 = {
+        "status": "completed",
+        "pages": [{"url": "https://test.com/2", "name": "Test Page 2"}],
+    }
+    mock = requests_mock.get(
+        f"{client.base_url}/web/crawl/{job_id}",
+        [{"json": mock_response1}, {"json": mock_response2}],
+    )
+
+    pages = client.web.iter_crawl_results(job_id=job_id)
+    assert mock.call_count == 0
+    assert next(pages).name == "Test Page 1"
+    assert mock.call_count == 1
+    assert [page.name for page in pages] == ["Test Page 2"]
+    assert mock.call_count == 2
+    assert mock.last_request.qs["next"] == ["page2"]
+
+
 def test_get_crawl_results_failed(client: Supadata, requests_mock) -> None:
     """Test getting crawl results for a failed job."""
     job_id = "test-job-123"
@@ -380,6 +590,96 @@ def test_youtube_playlist(client: Supadata, requests_mock) -> None:
     assert playlist.channel == mock_response["channel"]
 
 
+def test_youtube_playlist_missing_fields(client: Supadata, requests_mock) -> None:
+    """Test sparse playlist responses fall back to the requested id and defaults."""
+    playlist_id = "PL0vfts4VzfNjQOM9VClyL5R0LeuTxlAR3"
+    requests_mock.get(
+        f"{client.base_url}/youtube/playlist?id={playlist_id}",
+        json={"title": "CS101", "channel": None},
+    )
+
+    playlist = client.youtube.playlist(playlist_id)
+    assert playlist.id == playlist_id
+    assert playlist.video_count == 0
+    assert playlist.channel == {"id": "", "name": ""}
+    assert playlist.description is None
+
+
+def test_youtube_metadata_cache(client: Supadata, requests_mock, monkeypatch) -> None:
+    """Test cached channel lookups skip the API until they expire."""
+    now = [1000.0]
+    monkeypatch.setattr("supadata.youtube._monotonic", lambda: now[0])
+    adapter = requests_mock.get(
+        f"{client.base_url}/youtube/channel", json={"id": "UC1", "name": "Channel"}
+    )
+
+    client.youtube.channel("UC1")
+    assert adapter.call_count == 1
+
+    client.youtube.configure_cache(maxsize=8, ttl=60)
+    first = client.youtube.channel("UC1")
+    assert client.youtube.channel("UC1") is first
+    assert adapter.call_count == 2
+
+    now[0] += 61
+    assert client.youtube.channel("UC1") is not first
+    assert adapter.call_count == 3
+
+    client.youtube.cache_clear()
+    client.youtube.channel("UC1")
+    assert adapter.call_count == 4
+
+
+def test_youtube_cache_bypass(client: Supadata, requests_mock) -> None:
+    """Test cache=False fetches a fresh result without touching the cache."""
+    adapter = requests_mock.get(
+        f"{client.base_url}/youtube/channel", json={"id": "UC1", "name": "Channel"}
+    )
+    batch_adapter = requests_mock.get(
+        f"{client.base_url}/youtube/batch/job1", json={"status": "completed"}
+    )
+    client.youtube.configure_cache()
+
+    cached = client.youtube.channel("UC1")
+    fresh = client.youtube.channel("UC1", cache=False)
+    assert fresh is not cached
+    assert client.youtube.channel("UC1") is cached
+    assert adapter.call_count == 2
+
+    client.youtube.batch.get_batch_results("job1", cache=False)
+    client.youtube.batch.get_batch_results("job1")
+    assert batch_adapter.call_count == 2
+
+
+def test_youtube_transcript_cache_keys_on_arguments(client: Supadata, requests_mock) -> None:
+    """Test cached transcripts are keyed by language and text flag."""
+    adapter = requests_mock.get(
+        f"{client.base_url}/youtube/transcript", json={"content": "Hello", "lang": "en"}
+    )
+    client.youtube.configure_cache()
+
+    with pytest.warns(DeprecationWarning):
+        first = client.youtube.transcript("vid1", text=True)
+        assert client.youtube.transcript("vid1", text=True) is first
+        client.youtube.transcript("vid1", lang="es", text=True)
+    assert adapter.call_count == 2
+
+
+def test_youtube_batch_results_cache_only_finished(client: Supadata, requests_mock) -> None:
+    """Test batch results are cached once the job has finished."""
+    adapter = requests_mock.get(
+        f"{client.base_url}/youtube/batch/job1",
+        [{"json": {"status": "active"}}, {"json": {"status": "completed"}}],
+    )
+    client.youtube.configure_cache()
+
+    assert client.youtube.batch.get_batch_results("job1").status == "active"
+    finished = client.youtube.batch.get_batch_results("job1")
+    assert finished.status == "completed"
+    assert client.youtube.batch.get_batch_results("job1") is finished
+    assert adapter.call_count == 2
+
+
 def test_youtube_playlist_invalid_id(client: Supadata, requests_mock) -> None:
     playlist_id = "PL0vfts4VzfNjQOM9VClyL50LeuTxlAR3"
     mock_response = {
@@ -559,6 +859,15 @@ def test_youtube_playlist_videos_invalid_id(client: Supadata, requests_mock) ->
 
 # --- Batch Tests ---
 
+def test_youtube_namespaces_are_cached(client: Supadata) -> None:
+    """Test YouTube namespace objects are created once per client."""
+    youtube = client.youtube
+    assert youtube.channel is youtube.channel
+    assert youtube.transcript is youtube.transcript
+    assert youtube.batch is youtube.batch
+    assert not hasattr(youtube.channel, "__dict__")
+
+
 def test_youtube_batch_transcript(client: Supadata, requests_mock) -> None:
     """Test creating a YouTube transcript batch job."""
     mock_response = {"jobId": "batch-transcript-job-123"}
@@ -670,8 +979,100 @@ def test_youtube_get_batch_results_failed(client: Supadata, requests_mock) -> No
     assert results.status == "failed"
 
 
+def test_youtube_poll_until_done(client: Supadata, requests_mock, monkeypatch) -> None:
+    """Test polling a batch job backs off until the job completes."""
+    job_id = "batch-job-poll"
+    requests_mock.get(
+        f"{client.base_url}/youtube/batch/{job_id}",
+        [
+            {"json": {"status": "queued"}},
+            {"json": {"status": "active"}},
+            {"json": {"status": "completed", "results": [{"videoId": "vid1"}]}},
+        ],
+    )
+    delays = []
+    monkeypatch.setattr("supadata.youtube._sleep", delays.append)
+
+    results = client.youtube.batch.poll_until_done(job_id, initial_delay=1, max_delay=1.5)
+    assert results.status == "completed"
+    assert results.results[0].video_id == "vid1"
+    assert delays == [1, 1.5]
+
+    requests_mock.get(f"{client.base_url}/youtube/batch/{job_id}", json={"status": "active"})
+    with pytest.raises(SupadataError) as exc_info:
+        client.youtube.batch.poll_until_done(job_id, timeout=0)
+    assert exc_info.value.error == "batch-timeout"
+
+
+def test_youtube_get_batch_results_many(client: Supadata, requests_mock) -> None:
+    """Test fetching several batch jobs keeps input order."""
+    requests_mock.get(
+        re.compile(f"{client.base_url}/youtube/batch/"),
+        json=lambda request, context: {"status": request.path.rsplit("/", 1)[1]},
+    )
+    results = client.youtube.batch.get_batch_results_many(["queued", "active", "completed"])
+    assert [result.status for result in results] == ["queued", "active", "completed"]
+
+
+def test_null_dates_default_to_now() -> None:
+    """Test a None upload or update date falls back to the current time."""
+    before = datetime.now()
+    assert YoutubeVideo(id="v", uploaded_date=None).uploaded_date >= before
+    assert YoutubePlaylist(id="PL1", last_updated=None).last_updated >= before
+
+
+def test_utc_z_dates_are_parsed(client: Supadata, requests_mock) -> None:
+    """Test timestamps ending in 'Z' parse the same on every date path."""
+    expected = datetime(2024, 7, 6, tzinfo=timezone.utc)
+    requests_mock.get(
+        f"{client.base_url}/youtube/playlist", json={"lastUpdated": "2024-07-06T00:00:00Z"}
+    )
+    assert client.youtube.playlist("PL1").last_updated == expected
+
+    results = BatchResults(
+        status="completed", results=[{"video": {"id": "v", "upload_date": "2024-07-06T00:00:00Z"}}]
+    )
+    assert results.results[0].video.uploaded_date == expected
+
+
+def test_null_channel_becomes_placeholder() -> None:
+    """Test a null channel in search and batch results gets the empty placeholder."""
+    results = BatchResults(
+        status="completed", results=[{"video": {"id": "v", "channel": None, "tags": None}}]
+    )
+    video = results.results[0].video
+    assert video.channel == {"id": "", "name": ""}
+    assert video.tags == []
+
+    search = YoutubeSearchResponse.from_dict(
+        {"query": "q", "results": [{"id": "v", "channel": None}]}
+    )
+    assert search.results[0].channel == {"id": "", "name": ""}
+
+
+def test_batch_results_keeps_result_items() -> None:
+    """Test BatchResults keeps already-built items alongside raw dicts."""
+    item = BatchResultItem(video_id="vid1", error_code="transcript-unavailable")
+    results = BatchResults(status="completed", results=[item, {"video_id": "vid2"}])
+    assert results.results[0] is item
+    assert results.results[1] == BatchResultItem(video_id="vid2")
+
+
 # --- Universal Transcript Tests ---
 
+def test_transcript_many(client: Supadata, requests_mock) -> None:
+    """Test fetching several transcripts concurrently keeps input order."""
+    urls = [f"https://youtu.be/{i}" for i in range(5)]
+    requests_mock.get(
+        f"{client.base_url}/transcript",
+        json=lambda request, context: {"content": request.qs["url"][0], "lang": "en"},
+    )
+
+    transcripts = client.transcript_many(urls, text=True, concurrency=3)
+    assert [transcript.content for transcript in transcripts] == urls
+    assert all(request.qs["text"] == ["true"] for request in requests_mock.request_history)
+
+
 def test_transcript_immediate_chunks(client: Supadata, requests_mock) -> None:
     """Test getting transcript with immediate response as chunks."""
     url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
@@ -891,6 +1292,11 @@ def test_youtube_search_with_filters(client: Supadata, requests_mock) -> None:
     assert search_response.total_results == 50000
     assert len(search_response.results) == 1
 
+    sent = parse_qs(urlsplit(requests_mock.last_request.url).query)
+    assert sent["query"] == [query]
+    assert sent["sortBy"] == ["views"]
+    assert sent["features"] == ["hd", "subtitles"]
+    assert sent["limit"] == ["10"]
 
 
 def test_youtube_search_empty_query_error(client: Supadata) -> None:
@@ -913,6 +1319,13 @@ def test_youtube_search_invalid_limit_error(client: Supadata) -> None:
     assert "Invalid limit" in error.message
 
 
+def test_youtube_videos_rejects_bool_limit(client: Supadata) -> None:
+    """Test a bool is not accepted as a limit."""
+    with pytest.raises(SupadataError) as exc_info:
+        client.youtube.channel.videos(id="UC1", limit=True)
+    assert exc_info.value.error == "invalid-request"
+
+
 def test_youtube_search_api_error(client: Supadata, requests_mock) -> None:
     """Test YouTube search API error handling."""
     query = "test query"
@@ -1307,3 +1720,176 @@ def test_extract_error_handling(client: Supadata, requests_mock) -> None:
     error = exc_info.value
     assert error.error == "invalid-request"
     assert error.message == "Invalid Request"
+
+
+def _mock_async_client(api_key: str, base_url: str, handler) -> AsyncSupadata:
+    """Return an AsyncSupadata whose requests are served by handler."""
+    httpx = pytest.importorskip("httpx")
+    client = AsyncSupadata(api_key=api_key, base_url=base_url)
+    client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), headers=client._client.headers
+    )
+    return client
+
+
+def test_async_transcript(api_key: str, base_url: str) -> None:
+    """Test getting a transcript with the async client."""
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        assert request.url.path == "/v1/transcript"
+        assert request.headers["x-api-key"] == api_key
+        return httpx.Response(200, json={
+            "content": [{"text": "Hello", "offset": 0, "duration": 1000, "lang": "en"}],
+            "lang": "en",
+            "availableLangs": ["en", "es"],
+        })
+
+    async def run():
+        async with _mock_async_client(api_key, base_url, handler) as client:
+            return await client.transcript(url="https://youtu.be/test123")
+
+    transcript = asyncio.run(run())
+    assert isinstance(transcript, Transcript)
+    assert transcript.content[0].text == "Hello"
+    assert transcript.available_langs == ["en", "es"]
+
+
+def test_async_scrape_many_concurrently(api_key: str, base_url: str) -> None:
+    """Test async web requests can be gathered and errors are mapped."""
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        url = request.url.params["url"]
+        if url.endswith("missing"):
+            return httpx.Response(404, json={
+                "error": "not-found",
+                "message": "Not Found",
+                "details": "Page not found",
+            })
+        return httpx.Response(200, json={"url": url, "countCharacters": 10})
+
+    async def run():
+        async with _mock_async_client(api_key, base_url, handler) as client:
+            pages = await asyncio.gather(
+                *(client.web.scrape(f"https://test.com/{i}") for i in range(3))
+            )
+            with pytest.raises(SupadataError) as exc_info:
+                await client.web.scrape("https://test.com/missing")
+            return pages, exc_info.value
+
+    pages, error = asyncio.run(run())
+    assert [page.url for page in pages] == [f"https://test.com/{i}" for i in range(3)]
+    assert pages[0].count_characters == 10
+    assert error.error == "not-found"
+
+
+def test_async_crawl_results_and_scrape_many(api_key: str, base_url: str) -> None:
+    """Test async crawl results follow pagination and scrape_many keeps order."""
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        if request.url.path == "/v1/web/scrape":
+            return httpx.Response(200, json={"url": request.url.params["url"]})
+        if "next" in request.url.params:
+            return httpx.Response(200, json={"status": "completed", "pages": [{"url": "https://test.com/2"}]})
+        return httpx.Response(200, json={
+            "status": "completed", "pages": [{"url": "https://test.com/1"}], "next": "token",
+        })
+
+    urls = [f"https://test.com/{i}" for i in range(4)]
+
+    async def run():
+        async with _mock_async_client(api_key, base_url, handler) as client:
+            return await client.web.get_crawl_results("job"), await client.web.scrape_many(urls, concurrency=2)
+
+    crawled, pages = asyncio.run(run())
+    assert [page.url for page in crawled] == ["https://test.com/1", "https://test.com/2"]
+    assert [page.url for page in pages] == urls
+
+
+def test_async_transcript_many(api_key: str, base_url: str) -> None:
+    """Test fetching several transcripts concurrently keeps input order."""
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        url = request.url.params["url"]
+        if url.endswith("long"):
+            return httpx.Response(200, json={"jobId": "job-1"})
+        return httpx.Response(200, json={"content": url, "lang": "en"})
+
+    urls = ["https://youtu.be/a", "https://youtu.be/long", "https://youtu.be/b"]
+
+    async def run():
+        async with _mock_async_client(api_key, base_url, handler) as client:
+            return await client.transcript_many(urls, text=True, concurrency=2)
+
+    results = asyncio.run(run())
+    assert results[0] == Transcript(content=urls[0], lang="en")
+    assert results[1] == BatchJob(job_id="job-1")
+    assert results[2].content == urls[2]
+
+
+def test_async_youtube_and_metadata_many(api_key: str, base_url: str) -> None:
+    """Test async YouTube lookups and concurrent metadata fetches."""
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        if request.url.path == "/v1/youtube/playlist":
+            return httpx.Response(200, json={"title": "CS101", "lastUpdated": "2024-07-06T00:00:00"})
+        url = request.url.params["url"]
+        return httpx.Response(200, json={"platform": "youtube", "type": "video", "id": url[-1], "url": url})
+
+    urls = [f"https://youtu.be/{i}" for i in range(4)]
+
+    async def run():
+        async with _mock_async_client(api_key, base_url, handler) as client:
+            playlist = await client.youtube.playlist("PL1")
+            items = await client.metadata_many(urls, concurrency=2)
+            return playlist, items
+
+    playlist, items = asyncio.run(run())
+    assert playlist == YoutubePlaylist(
+        id="PL1", title="CS101", last_updated=datetime(2024, 7, 6)
+    )
+    assert [item.url for item in items] == urls
+
+
+def test_async_youtube_namespaces(api_key: str, base_url: str) -> None:
+    """Test async YouTube lookups are callable namespaces like in the sync client."""
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        return httpx.Response(200, json={"id": request.url.params["id"], "name": "Channel"})
+
+    async def run():
+        async with _mock_async_client(api_key, base_url, handler) as client:
+            assert not hasattr(client.youtube.channel, "__dict__")
+            with pytest.warns(DeprecationWarning):
+                await client.youtube.video("vid1")
+            return await client.youtube.channel("UC1")
+
+    assert asyncio.run(run()) == YoutubeChannel(id="UC1", name="Channel")
+
+
+def test_async_poll_until_done(api_key: str, base_url: str, monkeypatch) -> None:
+    """Test async batch polling waits between unfinished polls."""
+    httpx = pytest.importorskip("httpx")
+    statuses = iter(["queued", "active", "completed"])
+
+    def handler(request):
+        return httpx.Response(200, json={"status": next(statuses)})
+
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("supadata.async_client._sleep", fake_sleep)
+
+    async def run():
+        async with _mock_async_client(api_key, base_url, handler) as client:
+            return await client.youtube.batch.poll_until_done("job", initial_delay=1, max_delay=1.5)
+
+    assert asyncio.run(run()).status == "completed"
+    assert delays == [1, 1.5]